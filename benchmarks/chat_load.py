@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Chat Load Test
+Opens many concurrent Socket.IO connections against a running server, sends
+chat_message events from each and reports connect failures and reply latency.
+Needs python-socketio's asyncio client (pip install "python-socketio[asyncio_client]").
+Every client shares this machine's IP, so start the server with CHAT_IP_EVENT_RATE
+and CHAT_IP_EVENT_BURST raised above the offered load or most events are throttled.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+try:
+    import socketio
+except ImportError:
+    socketio = None
+
+MESSAGES = ['hello', 'what projects have you built?', 'which skills do you use?', 'tell me more']
+
+
+async def chat_client(url, messages, interval, latencies, errors):
+    """
+    Connect one client, send messages and record the latency of each reply
+
+    Args:
+        url (str): Server base URL
+        messages (int): Messages to send over the connection
+        interval (float): Seconds to wait between messages
+        latencies (list): Reply latencies in ms, appended to
+        errors (dict): Failure counts by kind, updated in place
+    """
+    client = socketio.AsyncClient(reconnection=False)
+    reply = asyncio.Queue()
+    client.on('chat_response', lambda data: reply.put_nowait(time.perf_counter()))
+
+    try:
+        await client.connect(url, transports=['websocket'])
+    except Exception:
+        errors['connect'] = errors.get('connect', 0) + 1
+        return
+
+    try:
+        for i in range(messages):
+            sent = time.perf_counter()
+            await client.emit('chat_message', {'message': MESSAGES[i % len(MESSAGES)]})
+            try:
+                received = await asyncio.wait_for(reply.get(), timeout=10)
+            except asyncio.TimeoutError:
+                errors['timeout'] = errors.get('timeout', 0) + 1
+                continue
+            latencies.append((received - sent) * 1000)
+            await asyncio.sleep(interval)
+    finally:
+        await client.disconnect()
+
+
+async def run(args):
+    latencies = []
+    errors = {}
+    clients = []
+    started = time.perf_counter()
+
+    # Ramp connections up in batches so the test measures steady state, not a SYN flood
+    for start in range(0, args.clients, args.ramp):
+        batch = min(args.ramp, args.clients - start)
+        clients.extend(
+            asyncio.create_task(chat_client(args.url, args.messages, args.interval, latencies, errors))
+            for _ in range(batch)
+        )
+        await asyncio.sleep(1)
+    await asyncio.gather(*clients)
+
+    return latencies, errors, time.perf_counter() - started
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the Socket.IO chat handler')
+    parser.add_argument('--url', default='http://localhost:5000', help='Server base URL')
+    parser.add_argument('--clients', type=int, default=2000, help='Concurrent connections (default: 2000)')
+    parser.add_argument('--messages', type=int, default=5, help='Messages per connection (default: 5)')
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between messages (default: 1)')
+    parser.add_argument('--ramp', type=int, default=200, help='Connections opened per second (default: 200)')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    if socketio is None:
+        print("❌ python-socketio is not installed; pip install \"python-socketio[asyncio_client]\"")
+        return
+
+    latencies, errors, elapsed = asyncio.run(run(args))
+
+    print("\n" + "=" * 60)
+    print("💬 CHAT LOAD TEST")
+    print("=" * 60)
+    print(f"Clients: {args.clients}  Messages each: {args.messages}  Duration: {elapsed:.1f}s")
+    print(f"Replies: {len(latencies)}  Connect failures: {errors.get('connect', 0)}  "
+          f"Timeouts: {errors.get('timeout', 0)}")
+
+    results = {'clients': args.clients, 'messages': args.messages, 'duration_s': elapsed,
+               'replies': len(latencies), 'errors': errors}
+    if latencies:
+        results.update({
+            'p50_ms': percentile(latencies, 0.50),
+            'p99_ms': percentile(latencies, 0.99),
+            'mean_ms': statistics.mean(latencies),
+            'max_ms': max(latencies)
+        })
+        print(f"Latency p50 {results['p50_ms']:.1f}ms  p99 {results['p99_ms']:.1f}ms  "
+              f"max {results['max_ms']:.1f}ms")
+    print("=" * 60)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
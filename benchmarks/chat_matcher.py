@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Chat Matcher Benchmark
+Compares the compiled chat intent matcher with a linear keyword scan as the
+number of intents grows
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+from app import ChatIntentMatcher, normalize_chat_text  # noqa: E402
+
+
+def make_intents(count, keywords_per_intent, rng):
+    """
+    Generate synthetic intents with random lowercase keywords
+
+    Args:
+        count (int): Number of intents
+        keywords_per_intent (int): Keywords per intent
+        rng (random.Random): Seeded generator
+
+    Returns:
+        list: Intent dicts in the chat_intents.json format
+    """
+    def word():
+        return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+
+    return [
+        {
+            'name': f'intent-{i}',
+            'priority': rng.randint(0, 10),
+            'keywords': [word() for _ in range(keywords_per_intent)],
+            'response': f'Response {i}'
+        }
+        for i in range(count)
+    ]
+
+
+def linear_match(intents, message):
+    """The per-keyword substring scan the compiled matcher replaces"""
+    message = normalize_chat_text(message)
+    for intent in intents:
+        for keyword in intent['keywords']:
+            if keyword in message:
+                return intent['response']
+    return None
+
+
+def time_per_message(match, messages, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for message in messages:
+            match(message)
+    return (time.perf_counter() - started) / (rounds * len(messages)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compiled vs linear chat intent matching')
+    parser.add_argument('--intents', type=int, nargs='+', default=[10, 100, 1000, 5000],
+                        help='Intent counts to benchmark (default: 10 100 1000 5000)')
+    parser.add_argument('--keywords', type=int, default=3, help='Keywords per intent (default: 3)')
+    parser.add_argument('--rounds', type=int, default=20, help='Passes over the message set (default: 20)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    print("\n" + "=" * 64)
+    print("💬 CHAT INTENT MATCHING")
+    print("=" * 64)
+    print(f"{'intents':>8}{'keywords':>10}{'compile (ms)':>14}{'linear (µs)':>14}{'compiled (µs)':>16}")
+
+    for count in args.intents:
+        rng = random.Random(args.seed)
+        intents = make_intents(count, args.keywords, rng)
+        keywords = [keyword for intent in intents for keyword in intent['keywords']]
+
+        # Half the messages hit a keyword, half miss everything (the linear worst case)
+        messages = [f"could you tell me about {rng.choice(keywords)} please" for _ in range(50)]
+        messages += ["what have you been working on lately and what do you enjoy" for _ in range(50)]
+
+        started = time.perf_counter()
+        matcher = ChatIntentMatcher(intents, 'default')
+        compile_ms = (time.perf_counter() - started) * 1000
+
+        linear = time_per_message(lambda m: linear_match(intents, m), messages, args.rounds)
+        compiled = time_per_message(matcher.match, messages, args.rounds)
+        print(f"{count:>8}{len(keywords):>10}{compile_ms:>14.1f}{linear:>14.1f}{compiled:>16.1f}")
+
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
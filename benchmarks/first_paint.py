@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+First Paint Measurement
+Reports the render-blocking bytes each public page needs before first paint,
+with and without critical CSS inlining. When the lighthouse CLI is installed
+and --base-url points at a running server, also reports lab FCP/LCP.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+from app import app  # noqa: E402
+from critical_css import PAGES  # noqa: E402
+
+
+class BlockingResourceParser(HTMLParser):
+    """Collect render-blocking stylesheets and scripts from <head>"""
+
+    def __init__(self):
+        super().__init__()
+        self.in_head = False
+        self.in_noscript = False
+        self.in_style = False
+        self.blocking = []
+        self.inline_css_bytes = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'head':
+            self.in_head = True
+        elif tag == 'noscript':
+            self.in_noscript = True
+        elif tag == 'style':
+            self.in_style = True
+        if not self.in_head or self.in_noscript:
+            return
+        if tag == 'link' and attrs.get('rel') == 'stylesheet' and attrs.get('media', 'all') in ('all', 'screen'):
+            self.blocking.append(attrs.get('href'))
+        elif tag == 'script' and attrs.get('src') and 'defer' not in attrs and 'async' not in attrs:
+            self.blocking.append(attrs.get('src'))
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.in_head = False
+        elif tag == 'noscript':
+            self.in_noscript = False
+        elif tag == 'style':
+            self.in_style = False
+
+    def handle_data(self, data):
+        if self.in_head and self.in_style:
+            self.inline_css_bytes += len(data.encode('utf-8'))
+
+
+def measure(client, path):
+    """
+    Measure one page
+
+    Args:
+        client: Flask test client
+        path (str): Page URL path
+
+    Returns:
+        dict: HTML size, inline CSS size and blocking resources with sizes
+    """
+    response = client.get(path)
+    parser = BlockingResourceParser()
+    parser.feed(response.get_data(as_text=True))
+
+    local_bytes = 0
+    external = []
+    for url in parser.blocking:
+        if urlparse(url).netloc:
+            external.append(url)
+        else:
+            local_bytes += len(client.get(url).get_data())
+    return {
+        'html_bytes': len(response.get_data()),
+        'inline_css_bytes': parser.inline_css_bytes,
+        'blocking_local_bytes': local_bytes,
+        'blocking_requests': len(parser.blocking),
+        'blocking_external': external
+    }
+
+
+def run_lighthouse(base_url, path):
+    """Run the lighthouse CLI against a live server, returning FCP/LCP in ms"""
+    result = subprocess.run(
+        ['lighthouse', base_url.rstrip('/') + path, '--quiet', '--output=json', '--output-path=stdout',
+         '--only-categories=performance', '--chrome-flags=--headless'],
+        capture_output=True, text=True, check=True
+    )
+    audits = json.loads(result.stdout)['audits']
+    return {
+        'fcp_ms': audits['first-contentful-paint']['numericValue'],
+        'lcp_ms': audits['largest-contentful-paint']['numericValue']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure render-blocking bytes before first paint')
+    parser.add_argument('--base-url', help='Running server to audit with lighthouse (optional)')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    client = app.test_client()
+    results = {}
+
+    print("\n" + "=" * 72)
+    print("🎨 FIRST PAINT: RENDER-BLOCKING RESOURCES")
+    print("=" * 72)
+    print(f"{'page':<10}{'mode':<10}{'html':>9}{'inline css':>12}{'blocking':>10}{'requests':>10}{'external':>10}")
+
+    for endpoint, path in PAGES.items():
+        results[endpoint] = {}
+        for mode, enabled in (('full', False), ('critical', True)):
+            app.config['CRITICAL_CSS_ENABLED'] = enabled
+            metrics = measure(client, path)
+            results[endpoint][mode] = metrics
+            print(f"{endpoint:<10}{mode:<10}{metrics['html_bytes']:>9}{metrics['inline_css_bytes']:>12}"
+                  f"{metrics['blocking_local_bytes']:>10}{metrics['blocking_requests']:>10}"
+                  f"{len(metrics['blocking_external']):>10}")
+
+        if args.base_url and shutil.which('lighthouse'):
+            results[endpoint]['lighthouse'] = run_lighthouse(args.base_url, path)
+            print(f"{'':<10}lighthouse FCP {results[endpoint]['lighthouse']['fcp_ms']:.0f}ms "
+                  f"LCP {results[endpoint]['lighthouse']['lcp_ms']:.0f}ms")
+
+    print("=" * 72)
+    if args.base_url and not shutil.which('lighthouse'):
+        print("⚠️  lighthouse CLI not found; install it with npm i -g lighthouse for FCP/LCP")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
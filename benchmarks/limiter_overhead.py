@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Overhead Benchmark
+Measures requests/sec through the Flask test client with the limiter on and off,
+reporting the median of several alternating runs per mode
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+from app import app, limiter  # noqa: E402
+
+
+def run(client, path, requests):
+    """
+    Issue requests against a path and return requests/sec
+
+    Args:
+        client: Flask test client
+        path (str): URL path to request
+        requests (int): Number of requests to issue
+
+    Returns:
+        float: Requests per second
+    """
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path)
+        if response.status_code == 429:
+            raise RuntimeError(f"Rate limited on {path}; raise the limits for benchmarking")
+    return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark rate limiter overhead per route class')
+    parser.add_argument('--requests', type=int, default=2000,
+                        help='Requests per path and mode (default: 2000)')
+    parser.add_argument('--paths', nargs='+', default=['/health', '/static/css/main.css', '/', '/projects'],
+                        help='Paths to benchmark')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per path and mode; the median is reported (default: 5)')
+    args = parser.parse_args()
+
+    # Limits high enough that the benchmark measures bookkeeping cost, not rejections
+    app.config['RATELIMIT_PUBLIC_READ'] = '100000000 per day'
+    # The testing config disables rate limiting, in which case the limiter never hooks into
+    # requests; it has to be initialised enabled before the first request to be measured
+    app.config['RATELIMIT_ENABLED'] = True
+    limiter.init_app(app)
+
+    client = app.test_client()
+    for path in args.paths:
+        client.get(path)  # Warm up (database init, template compile)
+
+    print("\n" + "=" * 60)
+    print("🚦 RATE LIMITER OVERHEAD")
+    print("=" * 60)
+    print(f"{'path':<28}{'off (req/s)':>12}{'on (req/s)':>12}{'overhead':>10}")
+
+    for path in args.paths:
+        # Modes alternate so drift (CPU frequency, caches) affects both alike
+        results = {False: [], True: []}
+        for _ in range(args.repeat):
+            for enabled in (False, True):
+                limiter.enabled = enabled
+                app.config['RATELIMIT_ENABLED'] = enabled
+                results[enabled].append(run(client, path, args.requests))
+
+        off = statistics.median(results[False])
+        on = statistics.median(results[True])
+        overhead = (off - on) / off * 100
+        print(f"{path:<28}{off:>12.0f}{on:>12.0f}{overhead:>9.1f}%")
+
+    print("=" * 60)
+    print(f"Median of {args.repeat} runs of {args.requests} requests per path and mode")
+    print(f"Storage: {app.config.get('RATELIMIT_STORAGE_URI')}  Strategy: {app.config.get('RATELIMIT_STRATEGY')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Route Latency Benchmark
+Seeds a synthetic dataset (see flask seed) into a dedicated SQLite database, serves the app on a
+local threaded server (or targets --base-url) and measures p50/p99 latency and
+throughput for the main public routes. Contact form mail goes to a local SMTP
+sink. Results are written as JSON and can be compared with a previous run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import socketserver
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, 'benchmarks', '.data')
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+DEFAULT_DATABASE = os.path.join(DATA_DIR, 'bench.db')
+
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+DATASET = {'projects': 10000, 'posts': 50000, 'messages': 500000}
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Accept and discard mail, speaking just enough SMTP for smtplib"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode('ascii'))
+
+    def handle(self):
+        self.reply('220 bench-sink ESMTP')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('ascii', 'replace').strip().upper()
+            if command.startswith('EHLO'):
+                self.reply('250-bench-sink')
+                self.reply('250 8BITMIME')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                while self.rfile.readline() not in (b'.\r\n', b'.\n', b''):
+                    pass
+                self.server.messages += 1
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SMTPSinkHandler)
+        self.messages = 0
+
+
+def prepare_database(path, scale, reseed, seed):
+    """Point the app at the benchmark database, seeding it when missing
+
+    Returns:
+        tuple: (app module, row counts, published post slugs)
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if reseed and os.path.exists(path):
+        os.remove(path)
+    fresh = not os.path.exists(path)
+    os.environ['TEST_DATABASE_URL'] = 'sqlite:///' + path
+
+    import app as portfolio
+
+    counts = {name: int(count * scale) for name, count in DATASET.items()}
+    with portfolio.app.app_context():
+        portfolio.init_db()
+        if fresh:
+            timings = portfolio.seed_database(counts['projects'], counts['posts'], counts['messages'], seed=seed)
+            print(f"🌱 Seeded {counts} in {sum(elapsed for _, elapsed in timings.values()):.1f}s")
+        counts = {
+            'projects': portfolio.Project.query.count(),
+            'posts': portfolio.BlogPost.query.count(),
+            'messages': portfolio.ContactMessage.query.count()
+        }
+        slugs = [slug for (slug,) in portfolio.db.session.query(portfolio.BlogPost.slug)
+                 .filter_by(published=True).limit(1000)]
+    return portfolio, counts, slugs
+
+
+def start_server(flask_app):
+    """Serve the app on a threaded Werkzeug server on a free local port"""
+    from werkzeug.serving import make_server
+    server = make_server('127.0.0.1', 0, flask_app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_port}'
+
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+def fetch(base_url, method, path, body=None):
+    """Issue one request, returning (latency ms, status); redirects are not followed"""
+    data = urllib.parse.urlencode(body).encode('utf-8') if body else None
+    request = urllib.request.Request(base_url + path, data=data, method=method)
+    opener = urllib.request.build_opener(NoRedirect)
+    started = time.perf_counter()
+    try:
+        with opener.open(request, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return (time.perf_counter() - started) * 1000, status
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def benchmark(base_url, name, make_request, requests, concurrency, ok_statuses=(200,)):
+    """
+    Run one scenario at the given concurrency
+
+    Args:
+        base_url (str): Server base URL
+        name (str): Scenario name for output
+        make_request (callable): Returns (method, path, body) for request i
+        requests (int): Total requests
+        concurrency (int): Worker threads issuing requests
+
+    Returns:
+        dict: Latency percentiles (ms), throughput (req/s) and error count
+    """
+    for i in range(min(5, requests)):
+        fetch(base_url, *make_request(i))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda i: fetch(base_url, *make_request(i)), range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for latency, _ in outcomes]
+    errors = sum(1 for _, status in outcomes if status not in ok_statuses)
+    result = {
+        'requests': requests,
+        'concurrency': concurrency,
+        'p50_ms': percentile(latencies, 0.50),
+        'p99_ms': percentile(latencies, 0.99),
+        'mean_ms': statistics.mean(latencies),
+        'throughput_rps': requests / elapsed,
+        'errors': errors
+    }
+    print(f"{name:<22}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+          f"{result['throughput_rps']:>12.1f}{errors:>8}")
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous_path, results):
+    """Print p50/p99 changes against a previous results file"""
+    with open(previous_path) as f:
+        previous = json.load(f)['scenarios']
+    print(f"\n📊 Compared with {previous_path}")
+    print(f"{'scenario':<22}{'p50 Δ':>10}{'p99 Δ':>10}{'rps Δ':>10}")
+    for name, current in results.items():
+        if name not in previous:
+            continue
+        before = previous[name]
+
+        def change(key):
+            return (current[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+
+        print(f"{name:<22}{change('p50_ms'):>+9.1f}%{change('p99_ms'):>+9.1f}%{change('throughput_rps'):>+9.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark latency and throughput of the main routes')
+    parser.add_argument('--base-url', help='Benchmark a running server instead of an in-process one (it must use the same database '
+                             'to resolve post slugs; mail goes wherever that server is configured to send it)')
+    parser.add_argument('--database', default=DEFAULT_DATABASE, help='SQLite file for the seeded dataset')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Dataset scale factor (1.0 = 10k projects, 50k posts, 500k messages)')
+    parser.add_argument('--reseed', action='store_true', help='Recreate the dataset even if it exists')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per scenario (default: 200)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent clients (default: 8)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--output', help='Results JSON path (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--compare', help='Previous results JSON to compare against')
+    args = parser.parse_args()
+
+    portfolio, counts, slugs = prepare_database(args.database, args.scale, args.reseed, args.seed)
+    flask_app = portfolio.app
+
+    # Benchmark the application, not the limiter or CSRF rejections
+    flask_app.config['WTF_CSRF_ENABLED'] = False
+    flask_app.config['RATELIMIT_ENABLED'] = False
+    portfolio.limiter.enabled = False
+
+    sink = SMTPSink()
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+    flask_app.config['MAIL_SUPPRESS_SEND'] = False
+    mail_state = portfolio.mail.state
+    mail_state.server, mail_state.port = sink.server_address
+    mail_state.use_tls = mail_state.use_ssl = mail_state.suppress = False
+    mail_state.username = mail_state.password = None
+
+    base_url = args.base_url or start_server(flask_app)
+    if not slugs:
+        raise SystemExit("❌ No published posts in the benchmark database; run with --reseed")
+
+    scenarios = {
+        'home': lambda i: ('GET', '/', None),
+        'projects': lambda i: ('GET', '/projects', None),
+        'blog': lambda i: ('GET', '/blog', None),
+        'blog_post': lambda i: ('GET', f'/blog/{slugs[i % len(slugs)]}', None),
+        'api_projects': lambda i: ('GET', '/api/projects', None),
+        'contact_post': lambda i: ('POST', '/contact', {
+            'name': f'Bench {i}',
+            'email': f'bench{i}@example.com',
+            'subject': 'Benchmark message',
+            'message': 'This message was sent by the route latency benchmark.'
+        }),
+        'download_resume': lambda i: ('GET', '/download/resume', None)
+    }
+
+    print("\n" + "=" * 62)
+    print(f"⏱️  ROUTE LATENCY ({base_url})")
+    print("=" * 62)
+    print(f"{'scenario':<22}{'p50 (ms)':>10}{'p99 (ms)':>10}{'req/s':>12}{'errors':>8}")
+
+    results = {}
+    for name, make_request in scenarios.items():
+        # The contact form redirects after a successful submission
+        ok_statuses = (200, 302) if name == 'contact_post' else (200,)
+        results[name] = benchmark(base_url, name, make_request, args.requests, args.concurrency, ok_statuses)
+
+    print("=" * 62)
+    print(f"📧 SMTP sink received {sink.messages} messages")
+
+    output = args.output or os.path.join(RESULTS_DIR, datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'timestamp': datetime.now().isoformat(),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'dataset': counts,
+            'scenarios': results
+        }, f, indent=2)
+    print(f"✅ Results written to {os.path.relpath(output, ROOT)}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
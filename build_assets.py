@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Static Asset Builder
+Produces minified, content-hashed CSS/JS with precompressed .gz/.br siblings
+and a manifest the app uses to resolve url_for('static', ...) to hashed names
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+
+# Source assets, relative to static/
+ASSET_PATTERNS = ['css/*.css', 'js/*.js', 'vendor/animations.bundle.js']
+
+
+def minify_css(source):
+    """
+    Minify CSS with rcssmin
+
+    Args:
+        source (str): CSS source
+
+    Returns:
+        str: Minified CSS
+    """
+    return rcssmin.cssmin(source)
+
+
+def minify_js(source):
+    """
+    Minify JavaScript with rjsmin
+
+    Args:
+        source (str): JavaScript source
+
+    Returns:
+        str: Minified JavaScript
+    """
+    return rjsmin.jsmin(source)
+
+
+def hashed_name(relative_path, content):
+    """
+    Build the content-hashed file name for an asset
+
+    Args:
+        relative_path (str): Path relative to static/, e.g. css/main.css
+        content (bytes): Built asset content
+
+    Returns:
+        str: e.g. css/main.3f2a9c1b7d.css
+    """
+    digest = hashlib.sha256(content).hexdigest()[:10]
+    base, ext = os.path.splitext(relative_path)
+    return f"{base}.{digest}{ext}"
+
+
+def write_compressed(path, content):
+    """Write precompressed .gz (and .br when brotli is installed) siblings"""
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(content, quality=11))
+
+
+def remove_stale(relative_path, keep):
+    """Remove previously built hashed versions of an asset"""
+    base, ext = os.path.splitext(relative_path)
+    pattern = os.path.join(DIST_DIR, f"{base}.*{ext}")
+    for path in glob.glob(pattern) + glob.glob(pattern + '.gz') + glob.glob(pattern + '.br'):
+        if not os.path.basename(path).startswith(os.path.basename(keep)):
+            os.remove(path)
+
+
+def build(patterns=ASSET_PATTERNS, minify=True):
+    """
+    Build every matching asset into static/dist and write the manifest
+
+    Args:
+        patterns (list): Glob patterns relative to static/
+        minify (bool): Whether to minify sources
+
+    Returns:
+        dict: Manifest mapping source paths to dist paths
+    """
+    manifest = {}
+    for pattern in patterns:
+        for source_path in sorted(glob.glob(os.path.join(STATIC_DIR, pattern))):
+            relative_path = os.path.relpath(source_path, STATIC_DIR).replace(os.sep, '/')
+            with open(source_path, 'r', encoding='utf-8') as f:
+                source = f.read()
+
+            if minify:
+                source = minify_css(source) if relative_path.endswith('.css') else minify_js(source)
+            content = source.encode('utf-8')
+
+            output_name = hashed_name(relative_path, content)
+            output_path = os.path.join(DIST_DIR, output_name)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, 'wb') as f:
+                f.write(content)
+            write_compressed(output_path, content)
+            remove_stale(relative_path, output_name)
+
+            manifest[relative_path] = f"dist/{output_name}"
+            original_size = os.path.getsize(source_path)
+            gz_size = os.path.getsize(output_path + '.gz')
+            print(f"📦 {relative_path:<28} {original_size:>7} B → {len(content):>7} B (gzip {gz_size} B)")
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    print(f"✅ Wrote manifest with {len(manifest)} assets to {os.path.relpath(MANIFEST_PATH, ROOT)}")
+    if not brotli:
+        print("⚠️  brotli not installed; only .gz variants were written")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build hashed, minified and precompressed static assets')
+    parser.add_argument('--no-minify', action='store_true',
+                        help='Skip minification (still hashes and compresses)')
+    args = parser.parse_args()
+    missing = [name for name, module in (('rcssmin', rcssmin), ('rjsmin', rjsmin)) if module is None]
+    if missing and not args.no_minify:
+        # Shipping unminified files under minified names would go unnoticed otherwise
+        sys.exit(f"❌ {', '.join(missing)} not installed: pip install -r requirements.txt, or pass --no-minify")
+    build(minify=not args.no_minify)
+
+
+if __name__ == "__main__":
+    main()
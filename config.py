@@ -31,7 +31,52 @@ class Config:
     # Upload Configuration
     UPLOAD_FOLDER = os.path.join(basedir, 'static', 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
+
+    # Serve fingerprinted assets from static/dist when build_assets.py has produced a manifest
+    ASSET_PIPELINE_ENABLED = os.environ.get('ASSET_PIPELINE_ENABLED', 'True').lower() in ['true', '1', 't']
+
+    # Inline per-page critical CSS generated by critical_css.py and load main.css asynchronously
+    CRITICAL_CSS_ENABLED = os.environ.get('CRITICAL_CSS_ENABLED', 'True').lower() in ['true', '1', 't']
+
+    # Template compilation: on-disk bytecode cache, plus optional precompile at startup
+    JINJA_BYTECODE_CACHE = os.environ.get('JINJA_BYTECODE_CACHE', 'True').lower() in ['true', '1', 't']
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get('JINJA_BYTECODE_CACHE_DIR')
+    TEMPLATE_WARMUP = os.environ.get('TEMPLATE_WARMUP', 'False').lower() in ['true', '1', 't']
+
+    # Static site export (flask export-static)
+    STATIC_EXPORT_DIR = os.environ.get('STATIC_EXPORT_DIR') or os.path.join(basedir, 'build', 'site')
+    # Re-export pages affected by admin writes in a background thread
+    STATIC_REGENERATION_ENABLED = os.environ.get('STATIC_REGENERATION_ENABLED', 'False').lower() in ['true', '1', 't']
+
+    # Export Configuration
+    EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE') or 1000)
     
+    # Search Configuration ('auto' uses SQLite FTS5 when available, else an in-process index)
+    SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND') or 'auto'
+    SEARCH_RESULTS_LIMIT = int(os.environ.get('SEARCH_RESULTS_LIMIT') or 20)
+
+    # Projects filter-bar facet cache lifetime (seconds); writes in this process invalidate it immediately
+    PROJECT_FACETS_TTL = int(os.environ.get('PROJECT_FACETS_TTL') or 300)
+
+    # Socket.IO server: 'threading', 'eventlet' or 'gevent'. Threading is the default because
+    # the green modes need the process monkey-patched first, which wsgi.py does for them.
+    # A message queue (e.g. redis://) lets several worker processes broadcast to each other's clients
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE') or 'threading'
+    SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE') or None
+
+    # Chat event throttling: per-connection and per-IP token buckets (events/sec, burst),
+    # events in flight per connection, and dropped events before a client is disconnected
+    CHAT_EVENT_RATE = float(os.environ.get('CHAT_EVENT_RATE') or 1)
+    CHAT_EVENT_BURST = int(os.environ.get('CHAT_EVENT_BURST') or 5)
+    CHAT_IP_EVENT_RATE = float(os.environ.get('CHAT_IP_EVENT_RATE') or 5)
+    CHAT_IP_EVENT_BURST = int(os.environ.get('CHAT_IP_EVENT_BURST') or 20)
+    CHAT_MAX_PENDING = int(os.environ.get('CHAT_MAX_PENDING') or 3)
+    CHAT_ABUSE_THRESHOLD = int(os.environ.get('CHAT_ABUSE_THRESHOLD') or 20)
+    CHAT_MAX_MESSAGE_LENGTH = int(os.environ.get('CHAT_MAX_MESSAGE_LENGTH') or 1000)
+
+    # Chat intents (keywords -> reply); the file is reloaded when it changes on disk
+    CHAT_INTENTS_FILE = os.environ.get('CHAT_INTENTS_FILE') or os.path.join(basedir, 'data', 'chat_intents.json')
+
     # Rate Limiting Configuration
     RATELIMIT_STORAGE_URI = os.environ.get('REDIS_URL') or 'memory://'
     RATELIMIT_STRATEGY = os.environ.get('RATELIMIT_STRATEGY') or 'fixed-window'
@@ -41,11 +86,20 @@ class Config:
         "200 per day",
         "50 per hour"
     ]
+
+    # Per route-class limits (static files and /health are exempt); writes fall back to RATELIMIT_DEFAULT
+    RATELIMIT_PUBLIC_READ = os.environ.get('RATELIMIT_PUBLIC_READ') or '2000 per day;500 per hour'
+    RATELIMIT_WRITE = os.environ.get('RATELIMIT_WRITE')
     
     RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', 'True').lower() in ['true', '1', 't']
+
+    # Reject clients the shared limiter has already rejected in-process, until their limit resets
+    RATELIMIT_LOCAL_PRECHECK = os.environ.get('RATELIMIT_LOCAL_PRECHECK', 'True').lower() in ['true', '1', 't']
+    RATELIMIT_LOCAL_MAX_CLIENTS = int(os.environ.get('RATELIMIT_LOCAL_MAX_CLIENTS') or 10000)
     
     # Feature Flags
     AI_CHAT_ENABLED = os.environ.get('AI_CHAT_ENABLED', 'True').lower() in ['true', '1', 't']
+    AI_CHAT_RESULTS = int(os.environ.get('AI_CHAT_RESULTS') or 3)  # items per retrieval answer
     EMAIL_NOTIFICATIONS = os.environ.get('EMAIL_NOTIFICATIONS', 'True').lower() in ['true', '1', 't']
     DEBUG_TB_ENABLED = os.environ.get('DEBUG_TB_ENABLED', 'False').lower() in ['true', '1', 't']
     
@@ -59,7 +113,38 @@ class Config:
         'pool_recycle': 300,
         'pool_pre_ping': True
     }
-    
+
+    # Response Compression (disable when a reverse proxy already compresses)
+    COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'True').lower() in ['true', '1', 't']
+    COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE') or 500)  # bytes
+    COMPRESSION_LEVEL = int(os.environ.get('COMPRESSION_LEVEL') or 6)
+    COMPRESSION_MIMETYPES = [
+        'text/html',
+        'text/css',
+        'text/plain',
+        'text/csv',
+        'text/javascript',
+        'application/javascript',
+        'application/json',
+        'application/x-ndjson',
+        'application/xml',
+        'image/svg+xml'
+    ]
+
+    # Query Instrumentation
+    SQL_INSTRUMENTATION_ENABLED = os.environ.get('SQL_INSTRUMENTATION_ENABLED', 'True').lower() in ['true', '1', 't']
+    SQL_SLOW_QUERY_MS = float(os.environ.get('SQL_SLOW_QUERY_MS') or 100)
+    SQL_N_PLUS_ONE_DETECTION = os.environ.get('SQL_N_PLUS_ONE_DETECTION', 'False').lower() in ['true', '1', 't']
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.environ.get('SQL_N_PLUS_ONE_THRESHOLD') or 5)
+
+    # Request profiling: cProfile a fraction of requests, or any request sending
+    # PROFILING_HEADER from a logged-in admin (or with PROFILING_TOKEN as its value)
+    PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'False').lower() in ['true', '1', 't']
+    PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE') or 0.01)
+    PROFILING_HEADER = os.environ.get('PROFILING_HEADER') or 'X-Profile'
+    PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN')
+    PROFILING_BUFFER_SIZE = int(os.environ.get('PROFILING_BUFFER_SIZE') or 50)
+
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL') or 'INFO'
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -79,7 +164,13 @@ class DevelopmentConfig(Config):
     
     DEBUG_TB_ENABLED = True
     DEBUG_TB_INTERCEPT_REDIRECTS = False
-    
+
+    SQL_N_PLUS_ONE_DETECTION = True
+
+    # Serve source assets so edits show up without a rebuild
+    ASSET_PIPELINE_ENABLED = False
+    CRITICAL_CSS_ENABLED = False
+
     MAIL_SUPPRESS_SEND = False
     
     SESSION_COOKIE_SECURE = False
@@ -91,10 +182,14 @@ class ProductionConfig(Config):
     TESTING = False
     
     SESSION_COOKIE_SECURE = True
+
+    TEMPLATE_WARMUP = True
     
-    # Redis for production
+    # Redis for production, shared by all workers; moving-window is a sliding log so
+    # limits can't be doubled by bursting across a window boundary
     RATELIMIT_STORAGE_URI = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
-    RATELIMIT_STRATEGY = 'fixed-window'
+    RATELIMIT_STRATEGY = os.environ.get('RATELIMIT_STRATEGY') or 'moving-window'
+    RATELIMIT_IN_MEMORY_FALLBACK_ENABLED = True
     
     RATELIMIT_DEFAULT = [
         "200 per day",
@@ -119,7 +214,8 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = False
     
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # Benchmarks point this at a seeded file so the dataset survives between runs
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or 'sqlite:///:memory:'
     
     RATELIMIT_ENABLED = False
     MAIL_SUPPRESS_SEND = True
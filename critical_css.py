@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Critical CSS Extractor
+Renders the public pages, finds the elements above the fold and writes the
+subset of main.css they need to static/dist/critical/<endpoint>.css, which
+base.html inlines into <head> while the full stylesheet loads asynchronously
+"""
+
+import argparse
+import os
+import re
+import sys
+from html.parser import HTMLParser
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'static')
+OUTPUT_DIR = os.path.join(STATIC_DIR, 'dist', 'critical')
+STYLESHEET = os.path.join(STATIC_DIR, 'css', 'main.css')
+
+# Endpoint name -> URL rendered to discover above-the-fold markup
+PAGES = {
+    'index': '/',
+    'projects': '/projects',
+    'blog': '/blog',
+    'contact': '/contact',
+}
+
+# Selectors that always apply to the first paint
+ALWAYS_KEEP = {':root', '*', 'html', 'body'}
+
+# Interaction states never matter for the first paint
+INTERACTIVE_PSEUDO = re.compile(r':(hover|focus|focus-within|focus-visible|active|visited)\b')
+
+
+class AboveTheFoldParser(HTMLParser):
+    """Collect tag names, classes and ids up to the end of the first <section>"""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = {'html', 'body', 'main'}
+        self.classes = set()
+        self.ids = set()
+        self.section_depth = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        self.tags.add(tag)
+        for name, value in attrs:
+            if name == 'class' and value:
+                self.classes.update(value.split())
+            elif name == 'id' and value:
+                self.ids.add(value)
+        if tag == 'section':
+            self.section_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag == 'section' and not self.done:
+            self.section_depth -= 1
+            if self.section_depth == 0:
+                self.done = True
+
+
+def split_blocks(css):
+    """
+    Split CSS into top-level (prelude, body) pairs, matching nested braces
+
+    Args:
+        css (str): Stylesheet source with comments removed
+
+    Returns:
+        list: (prelude, body) tuples
+    """
+    blocks = []
+    position = 0
+    while True:
+        start = css.find('{', position)
+        if start == -1:
+            return blocks
+        depth = 1
+        end = start + 1
+        while depth and end < len(css):
+            if css[end] == '{':
+                depth += 1
+            elif css[end] == '}':
+                depth -= 1
+            end += 1
+        blocks.append((css[position:start].strip(), css[start + 1:end - 1].strip()))
+        position = end
+
+
+def selector_matches(selector, found):
+    """
+    Check whether a selector's key (rightmost) compound can match found elements
+
+    Args:
+        selector (str): A single selector (no commas)
+        found (AboveTheFoldParser): Elements seen above the fold
+
+    Returns:
+        bool: True if the rule may apply to the first paint
+    """
+    selector = selector.strip()
+    if selector in ALWAYS_KEEP:
+        return True
+    if INTERACTIVE_PSEUDO.search(selector):
+        return False
+
+    # Drop pseudo-elements/classes (including :not(...)) and attribute selectors
+    simplified = re.sub(r'::?[\w-]+(\([^)]*\))?', '', selector)
+    simplified = re.sub(r'\[[^\]]*\]', '', simplified)
+    compounds = [c for c in re.split(r'\s*[\s>+~]\s*', simplified) if c]
+    if not compounds:
+        return True
+
+    for compound in compounds:
+        tag = re.match(r'^[a-zA-Z][\w-]*', compound)
+        if tag and tag.group(0).lower() not in found.tags:
+            return False
+        if any(c not in found.classes for c in re.findall(r'\.([\w-]+)', compound)):
+            return False
+        if any(i not in found.ids for i in re.findall(r'#([\w-]+)', compound)):
+            return False
+    return True
+
+
+def extract(css, found):
+    """
+    Keep the rules of a stylesheet that can apply to the found elements
+
+    Keyframes are kept only when a kept rule references them.
+
+    Args:
+        css (str): Stylesheet source
+        found (AboveTheFoldParser): Elements seen above the fold
+
+    Returns:
+        str: Critical CSS
+    """
+    kept = []
+    keyframes = {}
+    for prelude, body in split_blocks(css):
+        if prelude.startswith('@keyframes'):
+            keyframes[prelude.split()[1]] = f"{prelude}{{{body}}}"
+        elif prelude.startswith(('@media', '@supports')):
+            inner = extract(body, found)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith('@font-face'):
+            kept.append(f"{prelude}{{{body}}}")
+        elif prelude.startswith('@'):
+            continue
+        else:
+            selectors = [s for s in prelude.split(',') if selector_matches(s, found)]
+            if selectors:
+                kept.append(f"{','.join(s.strip() for s in selectors)}{{{body}}}")
+
+    critical = ''.join(kept)
+    for name, rule in keyframes.items():
+        if re.search(rf'animation(-name)?\s*:[^;}}]*\b{re.escape(name)}\b', critical):
+            critical += rule
+    return critical
+
+
+def minify(css):
+    """Collapse whitespace in generated CSS"""
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).replace(';}', '}').strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract and write critical CSS for public pages')
+    parser.add_argument('--pages', nargs='+', default=list(PAGES),
+                        help=f"Endpoints to process (default: {' '.join(PAGES)})")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault('FLASK_ENV', 'testing')
+    from app import app
+
+    # Render with the plain stylesheet link so output doesn't depend on a previous run
+    app.config['CRITICAL_CSS_ENABLED'] = False
+
+    with open(STYLESHEET, 'r', encoding='utf-8') as f:
+        stylesheet = re.sub(r'/\*.*?\*/', '', f.read(), flags=re.S)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    client = app.test_client()
+    for endpoint in args.pages:
+        response = client.get(PAGES[endpoint])
+        if response.status_code != 200:
+            print(f"❌ {PAGES[endpoint]} returned {response.status_code}; skipping")
+            continue
+
+        found = AboveTheFoldParser()
+        found.feed(response.get_data(as_text=True))
+        critical = minify(extract(stylesheet, found))
+
+        with open(os.path.join(OUTPUT_DIR, f'{endpoint}.css'), 'w', encoding='utf-8') as f:
+            f.write(critical)
+        print(f"✂️  {endpoint:<10} {len(critical):>6} B critical of {len(stylesheet):>6} B "
+              f"({len(found.classes)} classes above the fold)")
+
+    print(f"✅ Critical CSS written to {os.path.relpath(OUTPUT_DIR, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
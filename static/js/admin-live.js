@@ -0,0 +1,71 @@
+// Live admin updates over the /admin Socket.IO namespace
+class AdminLiveUpdates {
+  constructor(options = {}) {
+    this.list = document.querySelector("[data-live-messages]");
+    this.limit = options.limit || null;
+    this.init();
+  }
+
+  init() {
+    if (typeof io === "undefined") return;
+
+    const socket = io("/admin");
+    socket.on("counter_update", (counters) => this.updateCounters(counters));
+    socket.on("new_message", (message) => this.addMessage(message));
+  }
+
+  updateCounters(counters) {
+    document.querySelectorAll("[data-counter]").forEach((element) => {
+      const value = counters[element.dataset.counter];
+      if (value !== undefined) {
+        element.textContent = value;
+      }
+    });
+  }
+
+  addMessage(message) {
+    if (!this.list) return;
+
+    // Built with textContent so message fields are never parsed as HTML
+    const item = document.createElement("div");
+    item.className = "message-item unread";
+
+    const header = document.createElement("div");
+    header.className = "message-header";
+    const name = document.createElement("strong");
+    name.textContent = message.name;
+    const email = document.createElement("span");
+    email.className = "message-email";
+    email.textContent = message.email;
+    const date = document.createElement("span");
+    date.className = "message-date";
+    date.textContent = message.created_at;
+    header.append(name, " ", email, " ", date);
+
+    const subject = document.createElement("p");
+    subject.className = "message-subject";
+    subject.textContent = message.subject;
+
+    const preview = document.createElement("p");
+    preview.className = "message-preview";
+    preview.textContent = message.preview;
+
+    const link = document.createElement("a");
+    link.className = "btn btn-small";
+    link.href = message.url;
+    link.textContent = "View Details";
+
+    item.append(header, subject, preview, link);
+
+    const empty = this.list.querySelector(".no-data, .no-messages");
+    if (empty) empty.remove();
+    this.list.prepend(item);
+
+    if (this.limit) {
+      const items = this.list.querySelectorAll(".message-item");
+      for (let i = this.limit; i < items.length; i++) {
+        items[i].remove();
+      }
+    }
+  }
+}
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ['FLASK_ENV'] = 'testing'
+os.environ.pop('TEST_DATABASE_URL', None)
+
+import app as portfolio  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """The app on a fresh in-memory database with the sample data from init_db()
+
+    No app context is left pushed: requests would share it, and with it g and the
+    per-request query stats.
+    """
+    flask_app = portfolio.app
+    with flask_app.app_context():
+        portfolio.db.drop_all()
+        portfolio.init_db()
+    flask_app.db_initialized = True
+    yield flask_app
+    with flask_app.app_context():
+        portfolio.db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,43 @@
+import re
+
+from app import BlogPost, User, db
+
+
+def add_posts(app, count, start=0):
+    """Publish posts, each by a different author so author loading can't hide behind the identity map"""
+    with app.app_context():
+        for i in range(start, start + count):
+            author = User(username=f'author{i}', email=f'author{i}@example.com')
+            author.set_password('password')
+            db.session.add(BlogPost(
+                title=f'Post {i}',
+                slug=f'post-{i}',
+                content=f'Content of post {i}. ' * 50,
+                excerpt=f'Excerpt {i}',
+                published=True,
+                author=author
+            ))
+        db.session.commit()
+
+
+def query_count(response):
+    """Query count reported by the db entry of the Server-Timing header"""
+    match = re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', response.headers.get('Server-Timing', ''))
+    assert match, response.headers.get('Server-Timing')
+    return int(match.group(1))
+
+
+POSTS = 5
+
+
+def test_blog_list_query_count_is_independent_of_post_count(app, client):
+    add_posts(app, POSTS)
+    response = client.get('/blog')
+    assert response.status_code == 200
+    queries = query_count(response)
+
+    add_posts(app, POSTS, start=POSTS)
+    response = client.get('/blog')
+    assert response.status_code == 200
+    assert f'Post {2 * POSTS - 1}'.encode() in response.data
+    assert query_count(response) == queries
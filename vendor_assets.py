@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Third-Party Asset Vendoring
+Copies pinned GSAP, Font Awesome, Inter font and Socket.IO client files into
+static/vendor so pages render without cross-origin requests, and bundles GSAP
+with gsap-animations.js into a single deferred script.
+
+Font Awesome, Inter and the Socket.IO client come from pinned PyPI wheels that carry the upstream
+release files unmodified, so they vendor anywhere pip works. GSAP is only
+published to npm and the CDNs, with no registry digest to check a download
+against, so it is only vendored once its hashes are in the lock: review the
+files and record them with --update-lock. Inter is instanced and subset with
+fontTools (pip install fonttools brotli) to the weights and characters the site uses.
+"""
+
+import argparse
+import functools
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import urllib.parse
+import urllib.request
+import zipfile
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:
+    subset = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'static')
+TEMPLATES_DIR = os.path.join(ROOT, 'templates')
+VENDOR_DIR = os.path.join(STATIC_DIR, 'vendor')
+LOCK_PATH = os.path.join(VENDOR_DIR, 'vendor.lock.json')
+
+GSAP_VERSION = '3.12.2'
+FONT_AWESOME_VERSION = '6.4.0'
+SOCKET_IO_VERSION = '4.7.2'
+
+GSAP_SCRIPTS = [
+    f'https://cdnjs.cloudflare.com/ajax/libs/gsap/{GSAP_VERSION}/gsap.min.js',
+    f'https://cdnjs.cloudflare.com/ajax/libs/gsap/{GSAP_VERSION}/ScrollTrigger.min.js',
+]
+
+# (package, version, path of the release files inside the wheel)
+FONT_AWESOME_WHEEL = ('fontawesomefree', FONT_AWESOME_VERSION, 'fontawesomefree/static/fontawesomefree/')
+# google/fonts ofl/inter, the same variable font Google Fonts serves
+INTER_WHEEL = ('fontpkg-inter', '4.1.post1', 'fontpkg_inter/files/Inter[opsz,wght].ttf')
+# The Socket.IO project publishes its browser client only to npm; this release of nicegui
+# ships the 4.7.2 build from socket.io-client's dist unmodified
+SOCKET_IO_WHEEL = ('nicegui', '1.4.20', 'nicegui/static/socket.io.min.js')
+
+# The weights the site requested from Google Fonts, kept as a variable axis range
+INTER_WEIGHTS = (300, 800)
+
+# Characters kept in the Inter subset on top of those found in the templates:
+# printable ASCII, Latin-1 and the punctuation and symbols that turn up in posts
+INTER_UNICODES = (
+    'U+0020-007E,U+00A0-00FF,U+0131,U+0152-0153,U+2013-2014,U+2018-201E,U+2022,'
+    'U+2026,U+2039-203A,U+20AC,U+2122,U+2190-2193,U+2212'
+)
+
+# OpenType features kept in the subset; everything else (stylistic sets, case, etc.) is dropped
+INTER_FEATURES = ['kern', 'liga', 'calt', 'ccmp', 'locl', 'mark', 'mkmk', 'tnum']
+
+# Google Fonts only serves woff2 to browsers it recognises
+BROWSER_USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+)
+
+
+def fetch(url):
+    """
+    Download a URL
+
+    Args:
+        url (str): URL to download
+
+    Returns:
+        bytes: Response body
+    """
+    request = urllib.request.Request(url, headers={'User-Agent': BROWSER_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def record(name, content, lock):
+    """
+    Record a hash in the lock, or verify it against the one already recorded
+
+    Args:
+        name (str): Lock key
+        content (bytes): Content to hash
+        lock (dict): Lock data mapping keys to sha256 digests
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    expected = lock.get(name)
+    if expected and expected != digest:
+        raise ValueError(f"Hash mismatch for {name}: expected {expected}, got {digest}")
+    lock[name] = digest
+
+
+def write(relative_path, content, icon):
+    """Write a file under static/vendor and report its size"""
+    path = os.path.join(VENDOR_DIR, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+    print(f"{icon} {relative_path:<48} {len(content):>8} B")
+
+
+def save(relative_path, content, lock):
+    """
+    Write a vendored file and record or verify its hash in the lock
+
+    Args:
+        relative_path (str): Path relative to static/vendor
+        content (bytes): File content
+        lock (dict): Lock data mapping paths to sha256 digests
+    """
+    record(relative_path, content, lock)
+    write(relative_path, content, '📥')
+
+
+@functools.lru_cache(maxsize=None)
+def fetch_wheel(package, version):
+    """
+    Download a pinned wheel from PyPI's simple index, checked against the digest it publishes
+
+    Returns:
+        tuple: (zipfile.ZipFile, wheel bytes)
+    """
+    index_url = f'https://pypi.org/simple/{package}/'
+    filename_prefix = f"{re.sub(r'[-_.]+', '_', package)}-{version}-"
+    links = re.findall(r'href="([^"#]+)#sha256=([0-9a-f]{64})"', fetch(index_url).decode('utf-8'))
+    wheels = [(url, digest) for url, digest in links
+              if os.path.basename(url).startswith(filename_prefix) and url.endswith('.whl')]
+    if not wheels:
+        raise ValueError(f"No wheel published for {package}=={version}")
+    url, digest = wheels[0]
+    content = fetch(urllib.parse.urljoin(index_url, url))
+    if hashlib.sha256(content).hexdigest() != digest:
+        raise ValueError(f"Download of {os.path.basename(url)} does not match PyPI's digest")
+    return zipfile.ZipFile(io.BytesIO(content)), content
+
+
+def open_wheel(wheel, lock):
+    """Fetch a (package, version, path) wheel, pinning the wheel's own hash in the lock"""
+    package, version, path = wheel
+    archive, content = fetch_wheel(package, version)
+    record(f'pypi:{package}=={version}', content, lock)
+    return archive, path
+
+
+def vendor_gsap(lock, update_lock=False):
+    """
+    Download GSAP scripts and bundle them with gsap-animations.js
+
+    Args:
+        lock (dict): Lock data mapping paths to sha256 digests
+        update_lock (bool): Record hashes of scripts the lock doesn't pin yet
+    """
+    parts = []
+    for url in GSAP_SCRIPTS:
+        name = f"gsap/{os.path.basename(url)}"
+        # Nothing upstream to check a CDN download against, so an unpinned one isn't trusted
+        if name not in lock and not update_lock:
+            raise RuntimeError(f"no pinned hash for {name}; review the download and re-run with --update-lock")
+        content = fetch(url)
+        save(name, content, lock)
+        parts.append(content.decode('utf-8'))
+
+    with open(os.path.join(STATIC_DIR, 'js', 'gsap-animations.js'), 'r', encoding='utf-8') as f:
+        parts.append(f.read())
+
+    # The app's animations are not pinned, so the bundle is rebuilt rather than hash-checked
+    bundle = '\n;\n'.join(parts).encode('utf-8')
+    write('animations.bundle.js', bundle, '🔗')
+
+
+def vendor_font_awesome(lock):
+    """Copy Font Awesome's CSS and the webfonts it references out of the fontawesomefree wheel"""
+    archive, prefix = open_wheel(FONT_AWESOME_WHEEL, lock)
+    css = archive.read(prefix + 'css/all.min.css')
+    save('fontawesome/css/all.min.css', css, lock)
+
+    webfonts = sorted(set(re.findall(r'url\(\.\./webfonts/([^)?#]+)', css.decode('utf-8'))))
+    for name in webfonts:
+        save(f'fontawesome/webfonts/{name}', archive.read(prefix + f'webfonts/{name}'), lock)
+
+
+def vendor_socket_io(lock):
+    """Copy the Socket.IO browser client used by the live admin pages"""
+    archive, path = open_wheel(SOCKET_IO_WHEEL, lock)
+    client = archive.read(path)
+    if f'Socket.IO v{SOCKET_IO_VERSION}' not in client[:200].decode('utf-8', 'replace'):
+        raise ValueError(f"{SOCKET_IO_WHEEL[0]}=={SOCKET_IO_WHEEL[1]} does not ship Socket.IO {SOCKET_IO_VERSION}")
+    save('socket.io/socket.io.min.js', client, lock)
+
+
+def template_characters():
+    """Every non-ASCII character used in the templates, so hard-coded copy never falls back"""
+    characters = set()
+    for root, dirs, files in os.walk(TEMPLATES_DIR):
+        for name in files:
+            if name.endswith('.html'):
+                with open(os.path.join(root, name), encoding='utf-8') as f:
+                    characters.update(c for c in f.read() if ord(c) > 0x7e)
+    return characters
+
+
+def vendor_inter(lock, unicodes=INTER_UNICODES):
+    """
+    Subset the Inter variable font to the site's weights and characters
+
+    Glyphs outside the requested characters, unused OpenType features and hinting are
+    dropped, then the opsz axis is pinned at its default and wght limited to INTER_WEIGHTS.
+    Writes static/vendor/fonts.css with an @font-face rule for the result.
+    """
+    if subset is None:
+        raise RuntimeError("fontTools is required to subset Inter; pip install fonttools brotli")
+
+    archive, path = open_wheel(INTER_WHEEL, lock)
+    font = TTFont(io.BytesIO(archive.read(path)))
+
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = INTER_FEATURES
+    options.hinting = False
+    options.desubroutinize = True
+    options.name_languages = [0x0409]
+    codepoints = set(subset.parse_unicodes(unicodes)) | {ord(c) for c in template_characters()}
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    # Instanced after subsetting, which would otherwise trip over glyphs the instancer dropped
+    font = instancer.instantiateVariableFont(font, {'opsz': None, 'wght': INTER_WEIGHTS})
+
+    # Keep head.modified from the source so re-running the script reproduces the same file
+    font.recalcTimestamp = False
+    buffer = io.BytesIO()
+    subset.save_font(font, buffer, options)
+    # Generated from the pinned wheel, so only the wheel is hash-checked (output varies with fontTools)
+    write('fonts/inter-subset.woff2', buffer.getvalue(), '✂️ ')
+
+    css = (
+        "@font-face {\n"
+        "  font-family: 'Inter';\n"
+        "  font-style: normal;\n"
+        f"  font-weight: {INTER_WEIGHTS[0]} {INTER_WEIGHTS[1]};\n"
+        "  font-display: swap;\n"
+        "  src: url(fonts/inter-subset.woff2) format('woff2');\n"
+        "}\n"
+    )
+    write('fonts.css', css.encode('utf-8'), '🔤')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vendor pinned third-party assets into static/vendor')
+    parser.add_argument('--update-lock', action='store_true',
+                        help='Re-record hashes instead of verifying them (use after bumping versions)')
+    parser.add_argument('--unicodes', default=INTER_UNICODES,
+                        help='Characters to keep in the Inter subset, in pyftsubset --unicodes syntax')
+    args = parser.parse_args()
+
+    lock = {}
+    if os.path.exists(LOCK_PATH) and not args.update_lock:
+        with open(LOCK_PATH) as f:
+            lock = json.load(f)
+
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    steps = [
+        ('GSAP', lambda lock: vendor_gsap(lock, args.update_lock)),
+        ('Font Awesome', vendor_font_awesome),
+        ('Inter', lambda lock: vendor_inter(lock, args.unicodes)),
+        ('Socket.IO client', vendor_socket_io)
+    ]
+    failed = []
+    for name, step in steps:
+        try:
+            step(lock)
+        except (OSError, RuntimeError) as e:
+            # Unreachable sources skip that asset; hash mismatches (ValueError) still abort
+            print(f"⚠️  {name} not vendored: {e}")
+            failed.append(name)
+
+    with open(LOCK_PATH, 'w') as f:
+        json.dump(lock, f, indent=2, sort_keys=True)
+    print(f"✅ {len(lock)} hashes recorded in {os.path.relpath(LOCK_PATH, ROOT)}")
+    print("📝 Re-run build_assets.py to fingerprint the animations bundle")
+    if failed:
+        sys.exit(f"❌ Not vendored: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Production Entry Point
+Runs the app with the Socket.IO server on an event-loop worker, so each chat
+connection is a cheap green thread rather than an OS thread.
+
+Single process:
+    python wsgi.py
+
+Gunicorn (one eventlet worker per process; Socket.IO needs sticky sessions when
+several processes sit behind a load balancer, and SOCKETIO_MESSAGE_QUEUE so
+they can reach each other's clients):
+    SOCKETIO_MESSAGE_QUEUE=redis://localhost:6379/1 \\
+        gunicorn --worker-class eventlet -w 1 --bind 0.0.0.0:5000 wsgi:app
+"""
+
+import os
+
+# Monkey patching has to happen before anything imports socket, threading or ssl
+ASYNC_MODE = os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'eventlet')
+if ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+from app import app, socketio, init_db  # noqa: E402
+
+
+def main():
+    host = os.environ.get('HOST', '0.0.0.0')
+    port = int(os.environ.get('PORT', 5000))
+
+    with app.app_context():
+        init_db()
+
+    print(f"🚀 Serving on http://{host}:{port} (Socket.IO async mode: {socketio.async_mode})")
+    if app.config.get('SOCKETIO_MESSAGE_QUEUE'):
+        print(f"📡 Socket.IO message queue: {app.config['SOCKETIO_MESSAGE_QUEUE']}")
+    socketio.run(app, host=host, port=port)
+
+
+if __name__ == "__main__":
+    main()